@@ -6,9 +6,10 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from slowapi.errors import RateLimitExceeded
 
-from src.config.settings import settings
+from src.config.settings import get_settings
 from src.config.logger import logger
 from src.models.response_models import HealthResponse
 from src.routes.horoscope_routes import router as horoscope_router
@@ -26,6 +27,7 @@ async def lifespan(app: FastAPI):
     Lifespan events for startup and shutdown
     """
     # Startup
+    settings = get_settings()
     logger.info("🚀 Starting Hastrology AI Server")
     logger.info(f"Environment: {settings.environment}")
     logger.info(f"Cache enabled: {settings.cache_enabled}")
@@ -44,7 +46,8 @@ app = FastAPI(
     title="Hastrology AI Server",
     description="AI-powered horoscope generation using Google Gemini",
     version="2.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Add rate limiting
@@ -110,7 +113,8 @@ async def clear_cache():
 
 if __name__ == "__main__":
     import uvicorn
-    
+
+    settings = get_settings()
     uvicorn.run(
         "main:app",
         host=settings.host,
@@ -4,19 +4,20 @@ Logging configuration for the AI server
 import logging
 import sys
 from pathlib import Path
-from .settings import settings
+from .settings import get_settings
 
 
 def setup_logger(name: str = "ai_server") -> logging.Logger:
     """
     Configure and return a logger instance
-    
+
     Args:
         name: Logger name
-        
+
     Returns:
         Configured logger instance
     """
+    settings = get_settings()
     logger = logging.getLogger(name)
     logger.setLevel(getattr(logging, settings.log_level.upper()))
     
@@ -1,6 +1,8 @@
 """
 Configuration management using Pydantic Settings
 """
+from functools import lru_cache
+
 from pydantic_settings import BaseSettings
 from pydantic import Field
 from typing import Optional
@@ -42,5 +44,13 @@ class Settings(BaseSettings):
         case_sensitive = False
 
 
-# Global settings instance
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Return the process-wide Settings instance.
+
+    Memoized so env/.env parsing runs once per process instead of at
+    import time; also usable as a FastAPI dependency via
+    Depends(get_settings).
+    """
+    return Settings()
@@ -2,7 +2,7 @@
 Error handling middleware for FastAPI
 """
 from fastapi import Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from ..config.logger import logger
 
@@ -19,7 +19,7 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
     
     logger.warning(f"Validation error on {request.url.path}: {errors}")
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={
             "detail": "Validation failed",
@@ -32,7 +32,7 @@ async def general_exception_handler(request: Request, exc: Exception):
     """Handle general exceptions"""
     logger.error(f"Unhandled exception on {request.url.path}: {exc}", exc_info=True)
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
             "detail": "Internal server error"
@@ -4,9 +4,11 @@ Rate limiting middleware using SlowAPI
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
-from ..config.settings import settings
+from ..config.settings import get_settings
 
 
+settings = get_settings()
+
 # Create limiter instance
 limiter = Limiter(
     key_func=get_remote_address,
@@ -2,23 +2,69 @@
 Cosmic Data Object (CDO) Pydantic Models
 High-fidelity data structure for pandit-level astrological calculations
 """
-from typing import List, Optional, Literal
-from pydantic import BaseModel, Field
+from enum import Enum
+from functools import cached_property
+from typing import NamedTuple, Optional, Tuple
+from pydantic import BaseModel, ConfigDict, Field
+
+# Shared config: CDO objects are immutable snapshots of a chart, schema
+# build is deferred until first validation to keep import cheap.
+# use_enum_values stores the closed-vocabulary fields as plain strings so
+# model_dump() output and downstream string comparisons are unchanged.
+_CDO_CONFIG = ConfigDict(
+    frozen=True, defer_build=True, extra="ignore", use_enum_values=True,
+    validate_default=False
+)
+
+
+class AspectType(str, Enum):
+    """Closed vocabulary for aspect types"""
+    CONJUNCTION = "conjunction"
+    OPPOSITION = "opposition"
+    TRINE = "trine"
+    SQUARE = "square"
+    SEXTILE = "sextile"
+
+
+class AspectNature(str, Enum):
+    """Closed vocabulary for aspect natures"""
+    HARD = "hard"
+    SOFT = "soft"
+    NEUTRAL = "neutral"
+
+
+class ActivationIntensity(str, Enum):
+    """Closed vocabulary for Time Lord activation intensity"""
+    HIGH = "high"
+    CHALLENGING = "challenging"
+    SUPPORTIVE = "supportive"
+
+
+class ChartSect(str, Enum):
+    """Closed vocabulary for chart sect"""
+    DIURNAL = "Diurnal"
+    NOCTURNAL = "Nocturnal"
+
+
+class MaleficSeverity(str, Enum):
+    """Closed vocabulary for Saturn's sect-based severity"""
+    CONSTRUCTIVE = "constructive"
+    CHALLENGING = "challenging"
+    DIFFICULT = "difficult"
 
 
 class PlanetPosition(BaseModel):
     """Position and state of a single planet"""
+    model_config = _CDO_CONFIG
     planet: str = Field(..., description="Planet name (Sun, Moon, Mercury, etc.)")
     sign: str = Field(..., description="Zodiac sign the planet occupies")
-    house: int = Field(..., ge=1, le=12, description="Whole Sign House number (1-12)")
-    degree: float = Field(..., ge=0, lt=360, description="Absolute ecliptic longitude in degrees")
-    sign_degree: float = Field(..., ge=0, lt=30, description="Degree within the sign (0-30)")
+    house: int = Field(..., description="Whole Sign House number (1-12)")
+    degree: float = Field(..., description="Absolute ecliptic longitude in degrees")
+    sign_degree: float = Field(..., description="Degree within the sign (0-30)")
     speed: float = Field(..., description="Daily motion in degrees (negative = retrograde)")
     is_retrograde: bool = Field(default=False, description="True if planet is retrograde")
     dignity_score: int = Field(
-        default=0, 
-        ge=-5, 
-        le=5, 
+        default=0,
         description="Dignity: +5 domicile, +4 exalt, -4 detriment, -5 fall"
     )
     is_combust: bool = Field(default=False, description="Within 8.5° of Sun (weakened)")
@@ -27,37 +73,47 @@ class PlanetPosition(BaseModel):
 
 class Aspect(BaseModel):
     """Aspect between two planets"""
+    model_config = _CDO_CONFIG
     planet1: str = Field(..., description="First planet in the aspect")
     planet2: str = Field(..., description="Second planet in the aspect")
-    aspect_type: Literal["conjunction", "opposition", "trine", "square", "sextile"] = Field(
-        ..., description="Type of aspect"
-    )
-    orb: float = Field(..., ge=0, description="Orb/difference from exact aspect in degrees")
+    aspect_type: AspectType = Field(..., description="Type of aspect")
+    orb: float = Field(..., description="Orb/difference from exact aspect in degrees")
     is_applying: bool = Field(..., description="True if aspect is applying (tightening)")
-    nature: Literal["hard", "soft", "neutral"] = Field(..., description="Nature of the aspect")
+    nature: AspectNature = Field(..., description="Nature of the aspect")
 
 
 class TimeLordActivation(BaseModel):
     """Transit activation of the Time Lord (Lord of the Year)"""
+    model_config = _CDO_CONFIG
     transiting_planet: str = Field(..., description="The transiting planet making the aspect")
     aspect_to_time_lord: str = Field(..., description="Type of aspect to Time Lord")
     orb: float = Field(..., description="Orb of the aspect")
     is_applying: bool = Field(..., description="Whether aspect is applying")
-    intensity: Literal["high", "challenging", "supportive"] = Field(
-        ..., description="Intensity level based on aspect type"
-    )
+    intensity: ActivationIntensity = Field(..., description="Intensity level based on aspect type")
 
 
 class SectInfo(BaseModel):
     """Sect (day/night) status and its implications"""
+    model_config = _CDO_CONFIG
     is_day_chart: bool = Field(..., description="True if Sun is above horizon")
-    sect: Literal["Diurnal", "Nocturnal"] = Field(..., description="Chart sect")
+    sect: ChartSect = Field(..., description="Chart sect")
     benefic_of_sect: str = Field(..., description="Most helpful benefic (Jupiter day, Venus night)")
     malefic_of_sect: str = Field(..., description="More manageable malefic in this sect")
     malefic_contrary_to_sect: str = Field(..., description="Most difficult malefic in this sect")
-    malefic_severity: Literal["constructive", "challenging", "difficult"] = Field(
-        ..., description="How harsh Saturn's influence is based on sect"
-    )
+    malefic_severity: MaleficSeverity = Field(..., description="How harsh Saturn's influence is based on sect")
+
+
+class PlanetArrays(NamedTuple):
+    """
+    Structure-of-arrays view over a CDO's planet list.
+
+    Scoring loops (aspects, afflictions) iterate these flat tuples instead
+    of attribute-walking one PlanetPosition object per planet.
+    """
+    names: Tuple[str, ...]
+    degrees: Tuple[float, ...]
+    speeds: Tuple[float, ...]
+    dignity_scores: Tuple[int, ...]
 
 
 class CosmicDataObject(BaseModel):
@@ -65,35 +121,37 @@ class CosmicDataObject(BaseModel):
     The complete Cosmic Data Object (CDO) - High-fidelity chart data
     for personalized, pandit-level astrological analysis
     """
+    model_config = _CDO_CONFIG
+
     # Core Chart Info
     sect: SectInfo = Field(..., description="Sect status and benefic/malefic weights")
     ascendant_sign: str = Field(..., description="Rising sign (House 1)")
-    ascendant_degree: float = Field(..., ge=0, lt=30, description="Degree within ascendant sign")
+    ascendant_degree: float = Field(..., description="Degree within ascendant sign")
     is_cusp_ascendant: bool = Field(
         default=False, 
         description="True if Ascendant is within 1° of sign boundary (Cosmic Cusp)"
     )
     
     # Profections (Lord of the Year)
-    profection_house: int = Field(..., ge=1, le=12, description="Current profection house (1-12)")
+    profection_house: int = Field(..., description="Current profection house (1-12)")
     time_lord: str = Field(..., description="Lord of the Year from Annual Profections")
     profection_theme: str = Field(..., description="Theme of the profected house")
     
     # Planetary Positions
-    planets: List[PlanetPosition] = Field(..., description="All planetary positions")
+    planets: Tuple[PlanetPosition, ...] = Field(..., description="All planetary positions")
     
     # Aspects
-    aspects: List[Aspect] = Field(default_factory=list, description="Active aspects between planets")
+    aspects: Tuple[Aspect, ...] = Field(default=(), description="Active aspects between planets")
     
     # Time Lord Activations (The "Blame Factor")
-    time_lord_activations: List[TimeLordActivation] = Field(
-        default_factory=list,
+    time_lord_activations: Tuple[TimeLordActivation, ...] = Field(
+        default=(),
         description="Current transits aspecting the Time Lord"
     )
     
     # Afflictions
-    afflicted_planets: List[str] = Field(
-        default_factory=list,
+    afflicted_planets: Tuple[str, ...] = Field(
+        default=(),
         description="Planets with dignity_score <= -2 requiring remedies"
     )
     primary_affliction: Optional[str] = Field(
@@ -101,9 +159,25 @@ class CosmicDataObject(BaseModel):
         description="The most afflicted planet (for Shadow Warning focus)"
     )
 
+    # Derived bookkeeping, excluded from dumps so the LLM-facing JSON is
+    # unchanged: index into `aspects` of the first hard aspect, recorded
+    # at build time so summaries don't rescan the aspect list
+    first_hard_aspect_idx: Optional[int] = Field(default=None, exclude=True)
+
+    @cached_property
+    def planet_arrays(self) -> PlanetArrays:
+        """Parallel-array (SoA) view of `planets`, built once per object"""
+        return PlanetArrays(
+            names=tuple(p.planet for p in self.planets),
+            degrees=tuple(p.degree for p in self.planets),
+            speeds=tuple(p.speed for p in self.planets),
+            dignity_scores=tuple(p.dignity_score for p in self.planets),
+        )
+
 
 class CDOSummary(BaseModel):
     """Simplified CDO for AI prompt injection"""
+    model_config = _CDO_CONFIG
     sect: str = Field(..., description="Diurnal or Nocturnal")
     ascendant: str = Field(..., description="e.g., 'Virgo at 16°'")
     is_cusp: bool = Field(default=False, description="Cosmic cusp alert")
@@ -1,9 +1,16 @@
 """
 Response Pydantic models - Enhanced for CDO Architecture
+
+The Pydantic models remain the source of truth for the OpenAPI schema.
+The msgspec.Struct envelope at the bottom is what the hot request path
+actually serializes: it encodes through msgspec's C codec instead of
+walking pydantic-core schemas on every request.
 """
-from pydantic import BaseModel, Field
 from typing import Optional, Dict, Any
 
+import msgspec
+from pydantic import BaseModel, Field
+
 
 class LuckyAssets(BaseModel):
     """Lucky assets for the day"""
@@ -80,48 +87,6 @@ class HoroscopeResponse(BaseModel):
         default="cdo",
         description="Generation mode: 'cdo' for full CDO, 'fallback' if ephemeris unavailable"
     )
-    
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "card": {
-                    "front": {
-                        "tagline": "Mercury's Got Your Back Today ⚡",
-                        "luck_score": 78,
-                        "vibe_status": "Ascending",
-                        "energy_emoji": "🧠",
-                        "zodiac_sign": "Virgo",
-                        "time_lord": "Mercury",
-                        "profection_house": 10
-                    },
-                    "back": {
-                        "detailed_reading": "With Mercury as your Time Lord this year, your 10th house profection activates career themes. Today's applying trine from Jupiter to Mercury amplifies opportunities for recognition.",
-                        "hustle_alpha": "Your communication skills are your superpower today. Pitch that idea.",
-                        "shadow_warning": "Mars contrary to sect may trigger impatience. Pause before reacting.",
-                        "lucky_assets": {
-                            "number": "5",
-                            "color": "Emerald",
-                            "power_hour": "3:00 PM"
-                        },
-                        "time_lord_insight": "Mercury, your Year Lord, receives a supportive trine from transiting Jupiter. Expansion in Mercurial matters: writing, learning, deals.",
-                        "planetary_blame": "Jupiter trine Mercury (Applying, 2°) - Abundance meets intellect.",
-                        "remedy": None,
-                        "cusp_alert": None
-                    },
-                    "ruling_planet": "Mercury",
-                    "sect": "Diurnal",
-                    "cdo_summary": {
-                        "sect": "Diurnal",
-                        "ascendant": "Virgo at 16°",
-                        "time_lord": "Mercury",
-                        "profection_house": 10,
-                        "major_aspect": "Jupiter Trine Mercury (Applying)"
-                    }
-                },
-                "cached": False,
-                "generation_mode": "cdo"
-            }
-        }
 
 
 class HealthResponse(BaseModel):
@@ -147,7 +112,7 @@ class ErrorResponse(BaseModel):
     """Error response model"""
     detail: str = Field(..., description="Error details")
     error_code: Optional[str] = Field(default=None, description="Error code for debugging")
-    
+
     class Config:
         json_schema_extra = {
             "example": {
@@ -155,3 +120,16 @@ class ErrorResponse(BaseModel):
                 "error_code": "EPHEMERIS_INIT_FAILED"
             }
         }
+
+
+# --- msgspec envelope for the hot path ------------------------------------
+# The route layer wraps the already-validated card dict in this envelope
+# and encodes it with msgspec.json.Encoder(); the card itself is carried
+# as-is because the service layer validated it before caching (AstroCard
+# stays the schema's source of truth above).
+
+class HoroscopeResponseStruct(msgspec.Struct):
+    """msgspec mirror of HoroscopeResponse"""
+    card: Dict[str, Any]
+    cached: Optional[bool] = False
+    generation_mode: str = "cdo"
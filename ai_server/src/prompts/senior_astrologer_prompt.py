@@ -2,6 +2,11 @@
 Senior Vedic-Hellenistic Astrologer Prompt
 Advanced AI prompt for CDO-based horoscope generation with systematic synthesis
 """
+from bisect import bisect_right
+from functools import lru_cache
+from string import Formatter
+from types import MappingProxyType
+from typing import NamedTuple, Optional
 
 SENIOR_ASTROLOGER_PROMPT = """You are a Senior Vedic-Hellenistic Astrologer with 30 years of practice. You synthesize traditional techniques with modern psychological insight. Your readings are precise, attributing daily themes to SPECIFIC planetary configurations.
 
@@ -91,21 +96,61 @@ Generate a Dual-Sided Astro Card in this exact JSON structure:
 {format_instructions}
 """
 
-# Vibe status calculation helper
+# The ~3 KB template is pre-parsed once into (literal, field) segments so
+# each request is a dict lookup + join instead of re-parsing the template
+# through str.format. Values are substituted verbatim, so slot content may
+# safely contain braces (e.g. format_instructions with a JSON schema).
+_PROMPT_SEGMENTS = tuple(
+    (literal, field)
+    for literal, field, _spec, _conv in Formatter().parse(SENIOR_ASTROLOGER_PROMPT)
+)
+
+
+class PromptSlots(NamedTuple):
+    """Typed per-request values for the prompt template slots"""
+    cdo_json: str
+    sect: str
+    malefic_severity: str
+    ascendant: str
+    time_lord: str
+    profection_house: int
+    profection_theme: str
+    major_aspect: str
+    time_lord_activation: Optional[str]
+    cusp_alert: str
+    dignity_warning: str
+    format_instructions: str
+
+
+@lru_cache(maxsize=64)
+def render_prompt(slots: PromptSlots) -> str:
+    """
+    Render the astrologer prompt from the pre-parsed segments.
+
+    Cached on the full slot tuple: identical charts on the same day (same
+    CDO, same transits) reuse the rendered string outright.
+    """
+    parts = []
+    for literal, field in _PROMPT_SEGMENTS:
+        parts.append(literal)
+        if field is not None:
+            parts.append(str(getattr(slots, field)))
+    return "".join(parts)
+
+
+# Vibe status thresholds: < 40 Eclipse, < 60 Shaky, < 80 Ascending, else Stellar
+_VIBE_THRESHOLDS = (40, 60, 80)
+_VIBE_STATUSES = ("Eclipse", "Shaky", "Ascending", "Stellar")
+
+
+@lru_cache(maxsize=128)
 def calculate_vibe_status(luck_score: int) -> str:
     """Determine vibe status from luck score"""
-    if luck_score >= 80:
-        return "Stellar"
-    elif luck_score >= 60:
-        return "Ascending"
-    elif luck_score >= 40:
-        return "Shaky"
-    else:
-        return "Eclipse"
-
-
-# Energy emoji mapping
-ENERGY_EMOJIS = {
+    return _VIBE_STATUSES[bisect_right(_VIBE_THRESHOLDS, luck_score)]
+
+
+# Energy emoji mapping - read-only so cached lookups can never go stale
+ENERGY_EMOJIS = MappingProxyType({
     "Sun": "☀️",
     "Moon": "🌙",
     "Mercury": "🧠",
@@ -117,11 +162,12 @@ ENERGY_EMOJIS = {
     "Ascending": "📈",
     "Shaky": "⚡",
     "Eclipse": "🌑"
-}
+})
 
 
+@lru_cache(maxsize=128)
 def get_energy_emoji(time_lord: str, vibe_status: str) -> str:
     """Get appropriate emoji for the day's energy"""
-    if time_lord in ENERGY_EMOJIS:
-        return ENERGY_EMOJIS[time_lord]
-    return ENERGY_EMOJIS.get(vibe_status, "✨")
+    # Planet takes precedence over vibe status; no emoji value is falsy,
+    # so the chained get is equivalent to the membership check it replaces
+    return ENERGY_EMOJIS.get(time_lord) or ENERGY_EMOJIS.get(vibe_status, "✨")
@@ -1,14 +1,47 @@
 """
 API routes for horoscope generation - CDO Enhanced
 """
-from fastapi import APIRouter, HTTPException, status
+import time
+from collections import OrderedDict
+from typing import Tuple
+
+import msgspec
+from fastapi import APIRouter, HTTPException, Response, status
+from ..config.settings import get_settings
 from ..models.request_models import HoroscopeRequest
-from ..models.response_models import HoroscopeResponse, AstroCard
+from ..models.response_models import HoroscopeResponse, HoroscopeResponseStruct
 from ..services.horoscope_service import horoscope_service
 from ..config.logger import logger
 
 router = APIRouter()
 
+# Shared encoder - msgspec encoders are stateless and thread-safe
+_response_encoder = msgspec.json.Encoder()
+
+# LRU of fully-encoded response bodies keyed on the birth-detail triple.
+# A hit skips the service layer (and its JSON round-trip) entirely and
+# replays the bytes. Entries respect the same TTL as the service cache.
+_response_cache: "OrderedDict[str, Tuple[bytes, float]]" = OrderedDict()
+_RESPONSE_CACHE_MAX = 512
+
+
+def _cached_response(key: str) -> bytes:
+    """Return cached response bytes for key, or raise KeyError"""
+    body, timestamp = _response_cache[key]
+    if time.time() - timestamp >= get_settings().cache_ttl_seconds:
+        del _response_cache[key]
+        raise KeyError(key)
+    _response_cache.move_to_end(key)
+    return body
+
+
+def _store_response(key: str, body: bytes) -> None:
+    """Store encoded response bytes, evicting the least recently used"""
+    _response_cache[key] = (body, time.time())
+    _response_cache.move_to_end(key)
+    while len(_response_cache) > _RESPONSE_CACHE_MAX:
+        _response_cache.popitem(last=False)
+
 
 @router.post(
     "/generate_horoscope",
@@ -35,8 +68,21 @@ async def generate_horoscope(request: HoroscopeRequest):
         HTTPException: If horoscope generation fails
     """
     try:
-        logger.info(f"CDO Horoscope request: DOB={request.dob}, Lat={request.latitude}, Lon={request.longitude}")
-        
+        logger.info(
+            "CDO Horoscope request: DOB=%s, Lat=%s, Lon=%s",
+            request.dob, request.latitude, request.longitude
+        )
+
+        cache_enabled = get_settings().cache_enabled
+        cache_key = f"{request.dob}|{request.birth_time}|{request.birth_place}".lower()
+        if cache_enabled:
+            try:
+                body = _cached_response(cache_key)
+                logger.info("Route cache hit, replaying encoded response")
+                return Response(content=body, media_type="application/json")
+            except KeyError:
+                pass
+
         card_data, was_cached, generation_mode = await horoscope_service.generate_horoscope(
             dob=request.dob,
             birth_time=request.birth_time,
@@ -46,26 +92,43 @@ async def generate_horoscope(request: HoroscopeRequest):
             timezone_offset=request.timezone_offset or 0.0
         )
         
-        # Convert raw card data to AstroCard model
-        card = AstroCard(**card_data)
-        
-        logger.info(f"Generated horoscope (mode={generation_mode}, cached={was_cached})")
-        
-        return HoroscopeResponse(
-            card=card,
+        logger.info("Generated horoscope (mode=%s, cached=%s)", generation_mode, was_cached)
+
+        # The service layer already validated the card (cache hits were
+        # validated when first stored), so build the response envelope
+        # without re-validating - Struct construction does no per-field
+        # checks, the msgspec equivalent of model_construct()
+        body = _response_encoder.encode(HoroscopeResponseStruct(
+            card=card_data,
             cached=was_cached,
             generation_mode=generation_mode
-        )
-        
+        ))
+
+        # The static error card (generation failure) carries no
+        # cdo_summary; never cache it, or a transient LLM outage would
+        # pin "stars are recalibrating" on this chart for the full TTL
+        is_error_card = generation_mode == "fallback" and not card_data.get("cdo_summary")
+
+        if cache_enabled and not is_error_card:
+            # Replays are cache hits by definition, so store a variant
+            # with cached=True
+            _store_response(cache_key, _response_encoder.encode(HoroscopeResponseStruct(
+                card=card_data,
+                cached=True,
+                generation_mode=generation_mode
+            )))
+
+        return Response(content=body, media_type="application/json")
+
     except ValueError as e:
-        logger.error(f"Validation error: {e}")
+        logger.exception("Validation error in generate_horoscope")
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid input: {str(e)}"
+            detail={"message": "Invalid input", "error": str(e)}
         )
     except Exception as e:
-        logger.error(f"Error in generate_horoscope endpoint: {e}")
+        logger.exception("Error in generate_horoscope endpoint")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to generate horoscope: {str(e)}"
+            detail={"message": "Failed to generate horoscope", "error": str(e)}
         )
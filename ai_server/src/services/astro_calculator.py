@@ -2,12 +2,17 @@
 Astrological Calculator Service
 Implements Hellenistic/Vedic frameworks: Profections, Dignity, Aspects, Sect Logic
 """
-import json
 import os
+import pickle
+from collections import OrderedDict
 from datetime import datetime, date
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple, Any
 from pathlib import Path
 
+import numpy as np
+import orjson
+
 from ..config.logger import logger
 from ..models.cdo_models import (
     PlanetPosition, Aspect, TimeLordActivation, SectInfo, 
@@ -19,22 +24,49 @@ KNOWLEDGE_DIR = Path(__file__).parent.parent / "knowledge"
 
 
 def load_json_knowledge(filename: str) -> dict:
-    """Load a JSON knowledge file"""
+    """Load a JSON knowledge file via orjson (one read, C-level parse)"""
     filepath = KNOWLEDGE_DIR / filename
     try:
-        with open(filepath, 'r') as f:
-            return json.load(f)
+        return orjson.loads(filepath.read_bytes())
     except FileNotFoundError:
         logger.warning(f"Knowledge file not found: {filepath}")
         return {}
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         logger.error(f"Invalid JSON in {filepath}: {e}")
         return {}
 
 
+# Pre-parsed blob of both knowledge bases; rebuilt whenever a source JSON
+# file is newer than the cache
+_KNOWLEDGE_CACHE = KNOWLEDGE_DIR / "knowledge.cache.pkl"
+_KNOWLEDGE_SOURCES = ("astro_logic.json", "upayas.json")
+
+
+def load_knowledge_bases() -> Tuple[dict, dict]:
+    """
+    Load (astro_logic, upayas), preferring the pickled blob over
+    re-parsing JSON on every worker start.
+    """
+    try:
+        source_mtime = max(
+            (KNOWLEDGE_DIR / name).stat().st_mtime for name in _KNOWLEDGE_SOURCES
+        )
+        if _KNOWLEDGE_CACHE.stat().st_mtime >= source_mtime:
+            with open(_KNOWLEDGE_CACHE, 'rb') as f:
+                return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        pass  # Missing/stale/corrupt cache - fall through to the JSON parse
+
+    bases = tuple(load_json_knowledge(name) for name in _KNOWLEDGE_SOURCES)
+    try:
+        _KNOWLEDGE_CACHE.write_bytes(pickle.dumps(bases, protocol=pickle.HIGHEST_PROTOCOL))
+    except OSError as e:
+        logger.warning(f"Could not write knowledge cache: {e}")
+    return bases
+
+
 # Global knowledge bases
-ASTRO_LOGIC = load_json_knowledge("astro_logic.json")
-UPAYAS = load_json_knowledge("upayas.json")
+ASTRO_LOGIC, UPAYAS = load_knowledge_bases()
 
 ZODIAC_SIGNS = ASTRO_LOGIC.get("zodiac_signs", [
     "Aries", "Taurus", "Gemini", "Cancer", "Leo", "Virgo",
@@ -74,6 +106,51 @@ SECT_INFO = ASTRO_LOGIC.get("sect_benefics_malefics", {
     }
 })
 
+# There are exactly two possible sect configurations, so both SectInfo
+# instances are built once at import and handed out by reference
+# (the models are frozen, so sharing is safe)
+_SECT_DIURNAL = SectInfo(
+    is_day_chart=True,
+    sect="Diurnal",
+    benefic_of_sect=SECT_INFO["diurnal"].get("benefic_of_sect", "Jupiter"),
+    malefic_of_sect=SECT_INFO["diurnal"].get("malefic_of_sect", "Saturn"),
+    malefic_contrary_to_sect=SECT_INFO["diurnal"].get("malefic_contrary_to_sect", "Mars"),
+    malefic_severity="constructive"  # Saturn is in sect, more manageable
+)
+_NOCTURNAL_DATA = SECT_INFO.get("nocturnal", SECT_INFO["diurnal"])
+_SECT_NOCTURNAL = SectInfo(
+    is_day_chart=False,
+    sect="Nocturnal",
+    benefic_of_sect=_NOCTURNAL_DATA.get("benefic_of_sect", "Jupiter"),
+    malefic_of_sect=_NOCTURNAL_DATA.get("malefic_of_sect", "Saturn"),
+    malefic_contrary_to_sect=_NOCTURNAL_DATA.get("malefic_contrary_to_sect", "Mars"),
+    malefic_severity="difficult"  # Saturn is contrary to sect
+)
+
+# Integer-indexed dignity matrix: score_dignity resolves via two index
+# lookups and one int8 read instead of walking per-category sign lists.
+# Categories are applied in the same precedence order as the old if/elif
+# chain - first hit wins (Mercury is both domicile and exalted in Virgo).
+_ZODIAC_INDEX = {sign: i for i, sign in enumerate(ZODIAC_SIGNS)}
+
+
+def _build_dignity_matrix() -> Tuple[Dict[str, int], np.ndarray]:
+    planet_index = {planet: i for i, planet in enumerate(DIGNITY_TABLE)}
+    matrix = np.zeros((len(planet_index), len(ZODIAC_SIGNS)), dtype=np.int8)
+    for planet, row in planet_index.items():
+        dignities = DIGNITY_TABLE[planet]
+        for category in ("domicile", "exaltation", "detriment", "fall"):
+            score = DIGNITY_SCORES.get(category, 0)
+            for sign in dignities.get(category, []):
+                col = _ZODIAC_INDEX.get(sign)
+                if col is not None and matrix[row, col] == 0:
+                    matrix[row, col] = score
+    return planet_index, matrix
+
+
+_DIGNITY_PLANET_INDEX, _DIGNITY_MATRIX = _build_dignity_matrix()
+
+
 # Profection house themes
 HOUSE_THEMES = {
     1: "Self, Identity, and New Beginnings",
@@ -90,6 +167,50 @@ HOUSE_THEMES = {
     12: "Spirituality, Solitude, and Hidden Matters"
 }
 
+# Tuple-indexed view of HOUSE_THEMES: houses are a contiguous 1-12 range,
+# so direct indexing beats a dict hash. Slot 0 holds the fallback theme.
+_HOUSE_THEMES_TUP = ("General Life Themes",) + tuple(
+    HOUSE_THEMES[i] for i in range(1, 13)
+)
+
+
+# Exact node names the ephemeris layer can emit. Set membership replaces
+# the old '"Node" in name' substring scans on every planet filter.
+_NODE_NAMES = frozenset({
+    "TrueNode", "MeanNode", "NorthNode", "SouthNode",
+    "True Node", "Mean Node", "North Node", "South Node",
+    "Rahu", "Ketu"
+})
+
+# CDOs are deterministic in the chart + dates, so repeat queries for the
+# same natal chart within a day can reuse the assembled object outright
+_CDO_CACHE_MAX = 1024
+
+
+def _chart_fingerprint(planets: Dict[str, Any]) -> Tuple:
+    """
+    Hashable fingerprint of a planet-position mapping. Longitudes are
+    rounded to ~3.6 arcsec so near-identical queries (same chart, same
+    ephemeris instant) collapse onto one cache entry.
+    """
+    parts = []
+    for name, pos in planets.items():
+        lon, speed = _position_fields(pos)
+        parts.append((name, round(lon, 3), round(speed, 4)))
+    return tuple(parts)
+
+
+def _position_fields(pos: Any) -> Tuple[float, float]:
+    """
+    Return (longitude, speed) from either a PlanetData-like object or a
+    raw dict. EAFP attribute access is free on the common object path,
+    unlike the old per-field hasattr probes.
+    """
+    try:
+        return pos.longitude, pos.speed
+    except AttributeError:
+        return pos.get('longitude', 0), pos.get('speed', 0)
+
 
 class AstroCalculator:
     """
@@ -102,20 +223,36 @@ class AstroCalculator:
         self.planetary_rulers = PLANETARY_RULERS
         self.dignity_table = DIGNITY_TABLE
         self.aspect_definitions = ASPECT_DEFINITIONS
+        # Flattened aspect tuples: the hot loops unpack plain locals
+        # instead of re-hashing "angle"/"orb"/"nature" on every pair.
+        # _aspect_items keeps definition order (first-match semantics in
+        # the vectorized classifier); _aspects_by_angle is angle-sorted
+        # so scalar scans can stop once later angles are out of reach.
+        self._aspect_items = tuple(
+            (name, d["angle"], d["orb"], d["nature"])
+            for name, d in self.aspect_definitions.items()
+        )
+        self._aspects_by_angle = tuple(sorted(self._aspect_items, key=lambda a: a[1]))
+        self._max_aspect_orb = max(orb for _, _, orb, _ in self._aspect_items)
         self.upayas = UPAYAS
+        # LRU of assembled CDOs keyed on a chart fingerprint (see build_cdo)
+        self._cdo_cache: "OrderedDict[Tuple, CosmicDataObject]" = OrderedDict()
         logger.info("AstroCalculator initialized")
     
     def calculate_age(self, birth_date: date, current_date: date) -> int:
         """Calculate age in years"""
         age = current_date.year - birth_date.year
-        # Adjust if birthday hasn't occurred this year
-        if (current_date.month, current_date.day) < (birth_date.month, birth_date.day):
+        # Adjust if birthday hasn't occurred this year. The month*100+day
+        # integer key orders identically to the (month, day) tuple but
+        # compares as a single machine int (same key the batch path uses).
+        if current_date.month * 100 + current_date.day < birth_date.month * 100 + birth_date.day:
             age -= 1
         return max(0, age)
     
+    @lru_cache(maxsize=512)
     def calculate_profections(
-        self, 
-        birth_date: date, 
+        self,
+        birth_date: date,
         current_date: date,
         ascendant_sign: str
     ) -> Tuple[int, str, str]:
@@ -134,10 +271,9 @@ class AstroCalculator:
         """
         age = self.calculate_age(birth_date, current_date)
         
-        # Get ascendant sign index
-        try:
-            asc_index = ZODIAC_SIGNS.index(ascendant_sign)
-        except ValueError:
+        # Get ascendant sign index (O(1) dict lookup, not a list scan)
+        asc_index = _ZODIAC_INDEX.get(ascendant_sign)
+        if asc_index is None:
             logger.warning(f"Unknown ascendant sign: {ascendant_sign}, defaulting to Aries")
             asc_index = 0
         
@@ -152,12 +288,57 @@ class AstroCalculator:
         time_lord = self.planetary_rulers.get(profected_sign, "Sun")
         
         # House theme
-        house_theme = HOUSE_THEMES.get(profection_house, "General Life Themes")
+        house_theme = _HOUSE_THEMES_TUP[profection_house]  # Always 1-12 here
         
         logger.debug(f"Profections: Age {age}, House {profection_house}, Time Lord: {time_lord}")
         
         return profection_house, time_lord, house_theme
     
+    def calculate_profections_batch(
+        self,
+        birth_date: date,
+        dates: List[date],
+        ascendant_sign: str
+    ) -> List[Tuple[int, str, str]]:
+        """
+        Calculate Annual Profections for many dates in one vectorized pass.
+
+        Sweep workloads (e.g. a year of daily readings) should use this
+        instead of looping calculate_profections: ages, profected signs
+        and houses for every date come out of a handful of array ops.
+
+        Args:
+            birth_date: User's date of birth
+            dates: Dates to profect for
+            ascendant_sign: User's Ascendant (rising) sign
+
+        Returns:
+            List of (profection_house, time_lord, house_theme) tuples,
+            one per input date
+        """
+        asc_index = _ZODIAC_INDEX.get(ascendant_sign)
+        if asc_index is None:
+            logger.warning(f"Unknown ascendant sign: {ascendant_sign}, defaulting to Aries")
+            asc_index = 0
+
+        birth_key = birth_date.month * 100 + birth_date.day
+        years = np.array([d.year for d in dates]) - birth_date.year
+        keys = np.array([d.month * 100 + d.day for d in dates])
+        ages = np.maximum(years - (keys < birth_key), 0)
+
+        profected_signs = (asc_index + ages) % 12
+        houses = ages % 12 + 1
+
+        return [
+            (
+                int(house),
+                self.planetary_rulers.get(ZODIAC_SIGNS[sign_idx], "Sun"),
+                _HOUSE_THEMES_TUP[house]
+            )
+            for house, sign_idx in zip(houses, profected_signs)
+        ]
+
+    @lru_cache(maxsize=256)
     def score_dignity(self, planet: str, sign: str) -> int:
         """
         Calculate essential dignity score for a planet in a sign.
@@ -176,53 +357,26 @@ class AstroCalculator:
         Returns:
             Dignity score from -5 to +5
         """
-        if planet not in self.dignity_table:
-            return 0
-        
-        planet_dignities = self.dignity_table[planet]
-        
-        # Check each dignity level
-        if sign in planet_dignities.get("domicile", []):
-            return DIGNITY_SCORES["domicile"]
-        elif sign in planet_dignities.get("exaltation", []):
-            return DIGNITY_SCORES["exaltation"]
-        elif sign in planet_dignities.get("detriment", []):
-            return DIGNITY_SCORES["detriment"]
-        elif sign in planet_dignities.get("fall", []):
-            return DIGNITY_SCORES["fall"]
-        
-        return 0  # Peregrine
+        row = _DIGNITY_PLANET_INDEX.get(planet)
+        col = _ZODIAC_INDEX.get(sign)
+        if row is None or col is None:
+            return 0  # Unknown planet/sign, or outer planet: Peregrine
+        return int(_DIGNITY_MATRIX[row, col])
     
     def determine_sect(self, is_day_chart: bool) -> SectInfo:
         """
         Determine chart sect and its implications.
-        
+
         Day charts: Sun above horizon - Jupiter is benefic of sect, Saturn more manageable
         Night charts: Sun below horizon - Venus is benefic of sect, Saturn most difficult
-        
+
         Args:
             is_day_chart: True if Sun is above horizon
-            
+
         Returns:
-            SectInfo with benefic/malefic assignments
+            SectInfo with benefic/malefic assignments (shared precomputed instance)
         """
-        sect_key = "diurnal" if is_day_chart else "nocturnal"
-        sect_data = SECT_INFO.get(sect_key, SECT_INFO["diurnal"])
-        
-        # Determine Saturn's severity based on sect
-        if is_day_chart:
-            malefic_severity = "constructive"  # Saturn is in sect, more manageable
-        else:
-            malefic_severity = "difficult"  # Saturn is contrary to sect
-        
-        return SectInfo(
-            is_day_chart=is_day_chart,
-            sect="Diurnal" if is_day_chart else "Nocturnal",
-            benefic_of_sect=sect_data.get("benefic_of_sect", "Jupiter"),
-            malefic_of_sect=sect_data.get("malefic_of_sect", "Saturn"),
-            malefic_contrary_to_sect=sect_data.get("malefic_contrary_to_sect", "Mars"),
-            malefic_severity=malefic_severity
-        )
+        return _SECT_DIURNAL if is_day_chart else _SECT_NOCTURNAL
     
     def check_cusp(self, degree: float, threshold: float = 1.0) -> bool:
         """
@@ -252,81 +406,104 @@ class AstroCalculator:
         Returns:
             List of Aspect objects
         """
+        # Skip nodes for aspect calculations
+        names = tuple(name for name in planets if name not in _NODE_NAMES)
+        if len(names) < 2:
+            return []
+
+        lons = np.empty(len(names))
+        speeds = np.empty(len(names))
+        for idx, name in enumerate(names):
+            lons[idx], speeds[idx] = _position_fields(planets[name])
+
+        assigned, orbs = self._classify_aspect_pairs(lons, orb_multiplier)
+
         aspects = []
-        planet_names = list(planets.keys())
-        
-        for i, planet1 in enumerate(planet_names):
-            for planet2 in planet_names[i+1:]:
-                # Skip nodes for aspect calculations
-                if "Node" in planet1 or "Node" in planet2:
-                    continue
-                
-                pos1 = planets[planet1]
-                pos2 = planets[planet2]
-                
-                # Get longitudes (handle both dict and object)
-                lon1 = pos1.longitude if hasattr(pos1, 'longitude') else pos1.get('longitude', 0)
-                lon2 = pos2.longitude if hasattr(pos2, 'longitude') else pos2.get('longitude', 0)
-                speed1 = pos1.speed if hasattr(pos1, 'speed') else pos1.get('speed', 0)
-                speed2 = pos2.speed if hasattr(pos2, 'speed') else pos2.get('speed', 0)
-                
-                # Calculate angular separation
-                diff = abs(lon1 - lon2)
-                if diff > 180:
-                    diff = 360 - diff
-                
-                # Check against each aspect type
-                for aspect_name, aspect_def in self.aspect_definitions.items():
-                    angle = aspect_def["angle"]
-                    orb = aspect_def["orb"] * orb_multiplier
-                    
-                    if abs(diff - angle) <= orb:
-                        # Determine if applying or separating
-                        # Applying: faster planet approaching slower one
-                        is_applying = self._is_aspect_applying(
-                            lon1, lon2, speed1, speed2, angle
-                        )
-                        
-                        aspects.append(Aspect(
-                            planet1=planet1,
-                            planet2=planet2,
-                            aspect_type=aspect_name,
-                            orb=round(abs(diff - angle), 2),
-                            is_applying=is_applying,
-                            nature=aspect_def["nature"]
-                        ))
-                        break  # Only one aspect per planet pair
-        
+        upper_i, upper_j = np.triu_indices(len(names), k=1)
+        for i, j in zip(upper_i.tolist(), upper_j.tolist()):
+            k = assigned[i, j]
+            if k < 0:
+                continue
+            aspect_name, aspect_angle, _orb, nature = self._aspect_items[k]
+
+            # Determine if applying or separating
+            # Applying: faster planet approaching slower one
+            # float() casts keep the result a real bool - np.bool_ would
+            # slip through model_construct unvalidated
+            is_applying = self._is_aspect_applying(
+                float(lons[i]), float(lons[j]),
+                float(speeds[i]), float(speeds[j]), aspect_angle
+            )
+
+            aspects.append(Aspect.model_construct(
+                planet1=names[i],
+                planet2=names[j],
+                aspect_type=aspect_name,
+                orb=round(float(orbs[i, j]), 2),
+                is_applying=is_applying,
+                nature=nature
+            ))
+
         return aspects
     
+    def _classify_aspect_pairs(
+        self,
+        lons: np.ndarray,
+        orb_multiplier: float = 1.0
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Classify every planet pair against the aspect definitions in one
+        array pass.
+
+        Accepts a (..., N) longitude array - a single chart, or charts
+        stacked along leading axes for transit-sweep workloads - and
+        returns (assigned, orbs) where assigned[..., i, j] is the index of
+        the first matching aspect definition (or -1) and orbs[..., i, j]
+        the corresponding orb. First match wins in definition order,
+        matching the scalar loop's break semantics.
+
+        The two arrays double as the intermediate hit records: hits stay
+        as packed int8/float cells until calculate_aspects materializes
+        the final Aspect objects, so no per-hit Python object exists
+        before that point.
+        """
+        diff = np.abs(lons[..., :, None] - lons[..., None, :])
+        np.minimum(diff, 360.0 - diff, out=diff)
+
+        assigned = np.full(diff.shape, -1, dtype=np.int8)
+        orbs = np.zeros_like(diff)
+        for k, (_name, angle, orb, _nature) in enumerate(self._aspect_items):
+            delta = np.abs(diff - angle)
+            mask = (delta <= orb * orb_multiplier) & (assigned == -1)
+            assigned[mask] = k
+            orbs[mask] = delta[mask]
+        return assigned, orbs
+
     def _is_aspect_applying(
-        self, 
-        lon1: float, 
-        lon2: float, 
-        speed1: float, 
+        self,
+        lon1: float,
+        lon2: float,
+        speed1: float,
         speed2: float,
         aspect_angle: float
     ) -> bool:
         """
         Determine if an aspect is applying (getting tighter) or separating.
+
+        Uses the signed relative angular velocity instead of projecting
+        both positions a day ahead, which removes the second mod-360 fold
+        and is exact at the instant rather than a finite-difference guess.
         """
-        # Current difference
-        current_diff = abs(lon1 - lon2)
-        if current_diff > 180:
-            current_diff = 360 - current_diff
-        
-        # Projected difference in 1 day
-        future_lon1 = (lon1 + speed1) % 360
-        future_lon2 = (lon2 + speed2) % 360
-        future_diff = abs(future_lon1 - future_lon2)
-        if future_diff > 180:
-            future_diff = 360 - future_diff
-        
-        # If moving closer to exact aspect, it's applying
-        current_orb = abs(current_diff - aspect_angle)
-        future_orb = abs(future_diff - aspect_angle)
-        
-        return future_orb < current_orb
+        separation = (lon1 - lon2) % 360.0
+        if separation <= 180.0:
+            folded = separation
+            folded_rate = speed1 - speed2
+        else:
+            folded = 360.0 - separation
+            folded_rate = speed2 - speed1
+
+        # Applying when the orb |folded - aspect_angle| is shrinking
+        return (folded - aspect_angle) * folded_rate < 0
     
     def detect_time_lord_activations(
         self,
@@ -353,26 +530,23 @@ class AstroCalculator:
         if time_lord not in natal_planets:
             return activations
         
-        natal_tl = natal_planets[time_lord]
-        natal_lon = natal_tl.longitude if hasattr(natal_tl, 'longitude') else natal_tl.get('longitude', 0)
-        
+        natal_lon, _ = _position_fields(natal_planets[time_lord])
+
         for transit_planet, transit_data in transit_planets.items():
             # Skip if same planet
             if transit_planet == time_lord:
                 continue
-            
-            transit_lon = transit_data.longitude if hasattr(transit_data, 'longitude') else transit_data.get('longitude', 0)
-            transit_speed = transit_data.speed if hasattr(transit_data, 'speed') else transit_data.get('speed', 0)
+
+            transit_lon, transit_speed = _position_fields(transit_data)
             
             # Calculate aspect
             diff = abs(natal_lon - transit_lon)
             if diff > 180:
                 diff = 360 - diff
             
-            for aspect_name, aspect_def in self.aspect_definitions.items():
-                angle = aspect_def["angle"]
-                orb = aspect_def["orb"]
-                
+            for aspect_name, angle, orb, _nature in self._aspects_by_angle:
+                if angle - diff > self._max_aspect_orb:
+                    break  # Angle-sorted: later definitions only get farther
                 if abs(diff - angle) <= orb:
                     # Determine intensity based on aspect type
                     if aspect_name == "conjunction":
@@ -385,7 +559,7 @@ class AstroCalculator:
                     # Check if applying
                     is_applying = transit_speed != 0  # Simplified check
                     
-                    activations.append(TimeLordActivation(
+                    activations.append(TimeLordActivation.model_construct(
                         transiting_planet=transit_planet,
                         aspect_to_time_lord=aspect_name,
                         orb=round(abs(diff - angle), 2),
@@ -428,16 +602,50 @@ class AstroCalculator:
     ) -> CosmicDataObject:
         """
         Assemble the complete Cosmic Data Object from chart data.
-        
+
+        Results are cached on a fingerprint of the chart, dates and
+        transits: the same natal chart queried repeatedly within a day
+        (dashboard refreshes, multiple endpoints) reuses the immutable
+        CDO instead of recomputing dignities, aspects and activations.
+
         Args:
             chart_data: ChartData from ephemeris service
             birth_date: User's birth date
             current_date: Current date for transits
             transit_planets: Optional transit positions
-            
+
         Returns:
             Complete CosmicDataObject
         """
+        key = (
+            chart_data.ascendant_sign,
+            round(chart_data.ascendant_degree, 3),
+            chart_data.is_day_chart,
+            birth_date,
+            current_date.date(),
+            _chart_fingerprint(chart_data.planets),
+            _chart_fingerprint(transit_planets) if transit_planets else None
+        )
+        cached = self._cdo_cache.get(key)
+        if cached is not None:
+            self._cdo_cache.move_to_end(key)
+            return cached
+
+        cdo = self._build_cdo(chart_data, birth_date, current_date, transit_planets)
+
+        self._cdo_cache[key] = cdo
+        if len(self._cdo_cache) > _CDO_CACHE_MAX:
+            self._cdo_cache.popitem(last=False)
+        return cdo
+
+    def _build_cdo(
+        self,
+        chart_data: Any,
+        birth_date: date,
+        current_date: datetime,
+        transit_planets: Optional[Dict] = None
+    ) -> CosmicDataObject:
+        """Uncached CDO assembly - build_cdo handles the fingerprint cache"""
         # Calculate profections
         profection_house, time_lord, house_theme = self.calculate_profections(
             birth_date, current_date.date(), chart_data.ascendant_sign
@@ -456,21 +664,33 @@ class AstroCalculator:
         # Build planet positions with dignity scores
         planet_positions = []
         afflicted_planets = []
-        
-        for planet_name, planet_data in chart_data.planets.items():
-            if "Node" in planet_name:
-                continue  # Skip nodes for main list
-            
+        primary_affliction = None
+        min_dignity = 0
+
+        entries = [
+            (name, data) for name, data in chart_data.planets.items()
+            if name not in _NODE_NAMES  # Skip nodes for main list
+        ]
+
+        # Combust/cazimi as one vectorized kernel: fold every planet's
+        # distance to the Sun in a single pass instead of a call per planet
+        sun_diffs = np.abs(np.array([data.longitude for _, data in entries]) - sun_longitude)
+        np.minimum(sun_diffs, 360.0 - sun_diffs, out=sun_diffs)
+        cazimi_flags = sun_diffs <= 0.283  # 17 arcminutes
+        combust_flags = (sun_diffs <= 8.5) & ~cazimi_flags
+
+        for idx, (planet_name, planet_data) in enumerate(entries):
             dignity_score = self.score_dignity(planet_name, planet_data.sign)
-            
-            # Check combust/cazimi (skip Sun itself)
+
+            # Combust/cazimi flags (skip Sun itself)
             is_combust, is_cazimi = False, False
             if planet_name != "Sun":
-                is_combust, is_cazimi = self.check_combust_cazimi(
-                    planet_data.longitude, sun_longitude
-                )
-            
-            position = PlanetPosition(
+                is_combust = bool(combust_flags[idx])
+                is_cazimi = bool(cazimi_flags[idx])
+
+            # All fields are computed internally, so skip per-field
+            # validation - model_construct is the trusted-data fast path
+            position = PlanetPosition.model_construct(
                 planet=planet_name,
                 sign=planet_data.sign,
                 house=planet_data.house,
@@ -484,12 +704,19 @@ class AstroCalculator:
             )
             planet_positions.append(position)
             
-            # Track afflicted planets (dignity < -2)
+            # Track afflicted planets (dignity < -2) and the most
+            # afflicted one inline - no second scoring pass or sort needed
             if dignity_score <= -2:
                 afflicted_planets.append(planet_name)
+                if dignity_score < min_dignity:
+                    min_dignity = dignity_score
+                    primary_affliction = planet_name
         
-        # Calculate aspects
+        # Calculate aspects, noting the first hard one for the summary
         aspects = self.calculate_aspects(chart_data.planets)
+        first_hard_idx = next(
+            (i for i, a in enumerate(aspects) if a.nature == "hard"), None
+        )
         
         # Detect Time Lord activations (if transits provided)
         time_lord_activations = []
@@ -498,18 +725,9 @@ class AstroCalculator:
                 time_lord, chart_data.planets, transit_planets
             )
         
-        # Identify primary affliction (most negative dignity)
-        primary_affliction = None
-        if afflicted_planets:
-            # Sort by dignity score to find most afflicted
-            afflicted_scores = [
-                (p, self.score_dignity(p, chart_data.planets[p].sign))
-                for p in afflicted_planets
-            ]
-            afflicted_scores.sort(key=lambda x: x[1])
-            primary_affliction = afflicted_scores[0][0]
-        
-        return CosmicDataObject(
+        # model_construct skips validation, so coerce the collections to
+        # the tuples the validated model would have produced
+        return CosmicDataObject.model_construct(
             sect=sect_info,
             ascendant_sign=chart_data.ascendant_sign,
             ascendant_degree=chart_data.ascendant_degree,
@@ -517,28 +735,28 @@ class AstroCalculator:
             profection_house=profection_house,
             time_lord=time_lord,
             profection_theme=house_theme,
-            planets=planet_positions,
-            aspects=aspects,
-            time_lord_activations=time_lord_activations,
-            afflicted_planets=afflicted_planets,
-            primary_affliction=primary_affliction
+            planets=tuple(planet_positions),
+            aspects=tuple(aspects),
+            time_lord_activations=tuple(time_lord_activations),
+            afflicted_planets=tuple(afflicted_planets),
+            primary_affliction=primary_affliction,
+            first_hard_aspect_idx=first_hard_idx
         )
     
     def build_cdo_summary(self, cdo: CosmicDataObject) -> CDOSummary:
         """
         Create a simplified CDO summary for AI prompt injection.
         """
-        # Get major aspect (first hard aspect or most significant)
+        # Get major aspect - index recorded at build time, no rescan
         major_aspect = None
-        for aspect in cdo.aspects:
-            if aspect.nature == "hard":
-                aspect_str = f"{aspect.planet1} {aspect.aspect_type.capitalize()} {aspect.planet2}"
-                if aspect.is_applying:
-                    aspect_str += " (Applying)"
-                else:
-                    aspect_str += " (Separating)"
-                major_aspect = aspect_str
-                break
+        if cdo.first_hard_aspect_idx is not None:
+            aspect = cdo.aspects[cdo.first_hard_aspect_idx]
+            aspect_str = f"{aspect.planet1} {aspect.aspect_type.capitalize()} {aspect.planet2}"
+            if aspect.is_applying:
+                aspect_str += " (Applying)"
+            else:
+                aspect_str += " (Separating)"
+            major_aspect = aspect_str
         
         # Get Time Lord activation string
         tl_activation = None
@@ -3,16 +3,17 @@ In-memory cache service for horoscope responses
 """
 import hashlib
 import time
-from typing import Optional, Dict, Tuple
-from ..config.settings import settings
+from typing import Any, Dict, Optional, Tuple
+from ..config.settings import get_settings
 from ..config.logger import logger
 
 
 class CacheService:
     """Simple in-memory cache with TTL support"""
-    
+
     def __init__(self):
-        self.cache: Dict[str, Tuple[str, float]] = {}
+        settings = get_settings()
+        self.cache: Dict[str, Tuple[Any, float]] = {}
         self.enabled = settings.cache_enabled
         self.ttl = settings.cache_ttl_seconds
         logger.info(f"Cache service initialized (enabled={self.enabled}, ttl={self.ttl}s)")
@@ -81,6 +82,21 @@ class CacheService:
         self.cache[key] = (horoscope_text, time.time())
         logger.info(f"Cached horoscope for key: {key[:8]}... (total entries: {len(self.cache)})")
     
+    def get_obj(self, dob: str, birth_time: str, birth_place: str) -> Optional[Any]:
+        """
+        Get a cached Python object (zero-parse variant of get).
+
+        The in-process store is type-agnostic, so objects stored via
+        set_obj come back without any JSON round-trip. Treat the result
+        as read-only - it is shared with future cache hits. An
+        out-of-process tier (Redis) would serialize behind this method.
+        """
+        return self.get(dob, birth_time, birth_place)
+
+    def set_obj(self, dob: str, birth_time: str, birth_place: str, obj: Any) -> None:
+        """Store a Python object directly (zero-parse variant of set)"""
+        self.set(dob, birth_time, birth_place, obj)
+
     def clear(self) -> None:
         """Clear all cache entries"""
         self.cache.clear()
@@ -14,7 +14,7 @@ try:
 except ImportError:
     SWISSEPH_AVAILABLE = False
 
-from ..config.settings import settings
+from ..config.settings import get_settings
 from ..config.logger import logger
 
 
@@ -97,7 +97,7 @@ class EphemerisService:
             return
         
         # Set ephemeris path
-        self.ephe_path = ephe_path or settings.ephemeris_path
+        self.ephe_path = ephe_path or get_settings().ephemeris_path
         if os.path.exists(self.ephe_path):
             swe.set_ephe_path(self.ephe_path)
             # Check if actual .se1 files exist
@@ -344,6 +344,6 @@ class EphemerisService:
 
 # Global instance
 ephemeris_service = EphemerisService(
-    ephe_path=settings.ephemeris_path if SWISSEPH_AVAILABLE else None,
-    ayanamsa=settings.ayanamsa if SWISSEPH_AVAILABLE else "LAHIRI"
+    ephe_path=get_settings().ephemeris_path,
+    ayanamsa=get_settings().ayanamsa
 ) if SWISSEPH_AVAILABLE else None
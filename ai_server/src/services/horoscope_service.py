@@ -2,24 +2,28 @@
 Horoscope Service - CDO Architecture
 High-fidelity horoscope generation using Swiss Ephemeris and Cosmic Data Object
 """
-import json
+import asyncio
 import re
+from bisect import bisect_left
 from datetime import datetime, date
-from typing import Optional, Dict, Any, Tuple
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
 
-from pydantic import BaseModel, Field
+import msgspec
+import orjson
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
 
 from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import JsonOutputParser
 from langchain_core.exceptions import OutputParserException
 
-from ..config.settings import settings
+from ..config.settings import get_settings
 from ..config.logger import logger
 from .cache_service import cache_service
 from ..prompts.senior_astrologer_prompt import (
-    SENIOR_ASTROLOGER_PROMPT, 
-    calculate_vibe_status, 
+    PromptSlots,
+    render_prompt,
+    calculate_vibe_status,
     get_energy_emoji
 )
 
@@ -72,6 +76,211 @@ class AstroCard(BaseModel):
     cdo_summary: Optional[Dict[str, Any]] = Field(default=None)
 
 
+# Format instructions depend only on the AstroCard schema, so render them
+# once at import instead of per service instance
+_FORMAT_INSTRUCTIONS = JsonOutputParser(pydantic_object=AstroCard).get_format_instructions()
+
+# Compiled pydantic-core validator, built once at import. validate_json
+# fuses JSON parsing and validation in one Rust pass over the bytes,
+# unlike json.loads + AstroCard(**d)
+_ASTRO_ADAPTER = TypeAdapter(AstroCard)
+
+
+# Fallback lookup tables, hoisted so they are built once (the string
+# literals are interned by the compiler, so lookups hash pre-interned keys)
+_FALLBACK_ZODIAC = (
+    (20, "Capricorn"), (19, "Aquarius"), (20, "Pisces"), (20, "Aries"),
+    (21, "Taurus"), (21, "Gemini"), (22, "Cancer"), (23, "Leo"),
+    (23, "Virgo"), (23, "Libra"), (22, "Scorpio"), (21, "Sagittarius"),
+    (31, "Capricorn")
+)
+
+# Shared encoder for the CDO dict injected into the prompt
+_cdo_encoder = msgspec.json.Encoder(enc_hook=str)
+
+# Patterns compiled once at import - the hot paths skip re's internal
+# pattern-cache lookup entirely
+_DATE_DIGITS_RE = re.compile(r'(\d{1,2})[/\-](\d{1,2})[/\-](\d{4})')
+_TIME_12H_RE = re.compile(r'(\d{1,2}):(\d{2})\s*(AM|PM|am|pm)?')
+_TIME_24H_RE = re.compile(r'(\d{1,2}):(\d{2})')
+_FRONT_KEY_RE = re.compile(r'"front"\s*:\s*\{')
+
+
+def _extract_json_block(content: str) -> Optional[str]:
+    """
+    Return the first balanced top-level {...} block in content, or None.
+
+    One forward pass counting brace depth (quote/escape aware) replaces
+    the old greedy DOTALL regex, which matched from the first brace to
+    the last one in the string and so mis-sliced whenever the model
+    appended prose containing a stray brace after the JSON.
+    """
+    start = content.find('{')
+    if start < 0:
+        return None
+    depth = 0
+    in_str = False
+    esc = False
+    for i in range(start, len(content)):
+        char = content[i]
+        if esc:
+            esc = False
+        elif char == '\\':
+            esc = True
+        elif char == '"':
+            in_str = not in_str
+        elif in_str:
+            continue
+        elif char == '{':
+            depth += 1
+        elif char == '}':
+            depth -= 1
+            if depth == 0:
+                return content[start:i + 1]
+    return None
+
+
+class _FrontBlockExtractor:
+    """
+    Incremental scanner for the streamed card JSON.
+
+    feed() consumes token chunks and returns the parsed front dict once
+    the block's closing brace arrives, or None until then. Brace depth
+    is tracked string-aware (quotes and escapes), so braces inside
+    taglines don't confuse it; scan state persists between chunks, so
+    each character is examined once.
+    """
+
+    def __init__(self):
+        self._buf = ""
+        self._pos = 0
+        self._start = None
+        self._depth = 0
+        self._in_str = False
+        self._esc = False
+        self._done = False
+
+    def feed(self, text: str) -> Optional[Dict[str, Any]]:
+        if self._done:
+            return None
+        self._buf += text
+
+        if self._start is None:
+            match = _FRONT_KEY_RE.search(self._buf)
+            if not match:
+                # Keep a tail so a key split across chunks still matches
+                return None
+            self._start = match.end() - 1
+            self._pos = self._start
+
+        while self._pos < len(self._buf):
+            char = self._buf[self._pos]
+            self._pos += 1
+            if self._esc:
+                self._esc = False
+            elif char == '\\':
+                self._esc = True
+            elif char == '"':
+                self._in_str = not self._in_str
+            elif self._in_str:
+                pass
+            elif char == '{':
+                self._depth += 1
+            elif char == '}':
+                self._depth -= 1
+                if self._depth == 0:
+                    self._done = True
+                    try:
+                        return orjson.loads(self._buf[self._start:self._pos])
+                    except orjson.JSONDecodeError:
+                        return None
+        return None
+
+# Accepted DOB formats, tried in order after the ISO fast path
+_DATE_FORMATS = (
+    "%B %d, %Y",      # April 20, 1995
+    "%b %d, %Y",      # Apr 20, 1995
+    "%Y-%m-%d",       # 1995-4-20 (non-padded; padded ISO never gets here)
+    "%d/%m/%Y",       # 20/04/1995
+    "%m/%d/%Y",       # 04/20/1995
+    "%d-%m-%Y",       # 20-04-1995
+)
+
+# Day-of-year view of the table above: one bisect over the precomputed
+# boundaries replaces the per-call tuple indexing and month arithmetic.
+# Non-leap offsets are fine - Feb 29 and Mar 1 share a key and a sign.
+_MONTH_OFFSETS = (0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334)
+_ZODIAC_CUTOFFS = tuple(
+    _MONTH_OFFSETS[m] + _FALLBACK_ZODIAC[m][0] for m in range(12)
+)
+_ZODIAC_BY_DOY = (_FALLBACK_ZODIAC[-1][1],) + tuple(
+    _FALLBACK_ZODIAC[m][1] for m in range(12)
+)
+
+_FALLBACK_RULERS = {
+    "Aries": "Mars", "Taurus": "Venus", "Gemini": "Mercury",
+    "Cancer": "Moon", "Leo": "Sun", "Virgo": "Mercury",
+    "Libra": "Venus", "Scorpio": "Mars", "Sagittarius": "Jupiter",
+    "Capricorn": "Saturn", "Aquarius": "Saturn", "Pisces": "Jupiter"
+}
+
+
+# Required keys per card section. Set difference against dict.keys() is
+# a single C-level op, unlike per-field generator membership tests.
+_REQUIRED_CARD = frozenset({"front", "back", "ruling_planet"})
+_REQUIRED_FRONT = frozenset({
+    "tagline", "luck_score", "vibe_status", "energy_emoji", "zodiac_sign"
+})
+_REQUIRED_BACK = frozenset({
+    "detailed_reading", "hustle_alpha", "shadow_warning", "lucky_assets"
+})
+_REQUIRED_ASSETS = frozenset({"number", "color", "power_hour"})
+
+
+def _card_is_complete(card: Dict[str, Any]) -> bool:
+    """Check all required card fields are present (fast-path gate before
+    falling back to full model validation)"""
+    if _REQUIRED_CARD - card.keys():
+        return False
+    front, back = card["front"], card["back"]
+    if not isinstance(front, dict) or not isinstance(back, dict):
+        return False
+    if _REQUIRED_FRONT - front.keys() or _REQUIRED_BACK - back.keys():
+        return False
+    assets = back["lucky_assets"]
+    return isinstance(assets, dict) and not (_REQUIRED_ASSETS - assets.keys())
+
+
+# The fallback card is constant apart from time_lord and sect, so the
+# model tree is validated and dumped once at import; _get_fallback_card
+# copies the dict and patches the two dynamic fields instead of paying
+# the full Pydantic construction on every failure
+_FALLBACK_CARD_TEMPLATE: Dict[str, Any] = AstroCard(
+    front=HoroscopeFront(
+        tagline="The stars are recalibrating... ✨",
+        luck_score=50,
+        vibe_status="Shaky",
+        energy_emoji="🔮",
+        zodiac_sign="Unknown",
+        time_lord="Sun",
+        profection_house=1
+    ),
+    back=HoroscopeBack(
+        detailed_reading="Mercury retrograde in the cosmic servers. Your chart is being processed through the ethers. Check back soon for your personalized reading.",
+        hustle_alpha="Focus on grounding activities today. The stars will align shortly.",
+        shadow_warning="Avoid making major decisions until the cosmic connection stabilizes.",
+        lucky_assets=LuckyAssets(number="7", color="Silver", power_hour="Soon"),
+        time_lord_insight="Your Time Lord is gathering cosmic data.",
+        planetary_blame="Technical Mercury square Digital Saturn (Temporary)",
+        remedy="Take 5 deep breaths and try again.",
+        cusp_alert=None
+    ),
+    ruling_planet="Sun",
+    sect="Diurnal",
+    cdo_summary=None
+).model_dump()
+
+
 # --- Horoscope Service Implementation ---
 
 class HoroscopeService:
@@ -85,53 +294,58 @@ class HoroscopeService:
         try:
             # Using Gemini 1.5-flash for speed and better JSON adherence
             self.llm = ChatGoogleGenerativeAI(
-                model="gemini-1.5-flash", 
-                google_api_key=settings.google_api_key,
+                model="gemini-1.5-flash",
+                google_api_key=get_settings().google_api_key,
                 temperature=0.75,  # Slightly lower for more consistent output
                 max_retries=3
             )
             self.output_parser = JsonOutputParser(pydantic_object=AstroCard)
-            self.prompt = ChatPromptTemplate.from_template(
-                template=SENIOR_ASTROLOGER_PROMPT,
-                partial_variables={"format_instructions": self.output_parser.get_format_instructions()}
-            )
-            self.chain = self.prompt | self.llm
             
             self.cdo_enabled = CDO_ENABLED
+            # In-flight generations keyed like the cache: concurrent
+            # duplicate requests coalesce onto one Gemini round-trip
+            self._inflight: Dict[str, "asyncio.Task"] = {}
             logger.info(f"HoroscopeService initialized (CDO: {self.cdo_enabled})")
             
         except Exception as e:
             logger.error(f"Initialization failed: {e}")
             raise
     
+    # The date helpers below are pure functions of their arguments, and a
+    # returning user re-sends the same dob/birth_time strings on every
+    # request - lru_cache on the singleton turns the repeat parses into
+    # dict lookups (same pattern as the calculator's cached methods)
+    @lru_cache(maxsize=4096)
     def _parse_date(self, dob: str) -> datetime:
         """Parse date of birth string into datetime object"""
-        formats = [
-            "%B %d, %Y",      # April 20, 1995
-            "%b %d, %Y",      # Apr 20, 1995
-            "%Y-%m-%d",       # 1995-04-20
-            "%d/%m/%Y",       # 20/04/1995
-            "%m/%d/%Y",       # 04/20/1995
-            "%d-%m-%Y",       # 20-04-1995
-        ]
-        for fmt in formats:
+        stripped = dob.strip()
+
+        # Fast path: ISO 8601 is the primary on-wire format, and
+        # fromisoformat is a single C call with no exception churn
+        try:
+            return datetime.fromisoformat(stripped)
+        except ValueError:
+            pass
+
+        for fmt in _DATE_FORMATS:
             try:
-                return datetime.strptime(dob.strip(), fmt)
+                return datetime.strptime(stripped, fmt)
             except ValueError:
                 continue
-        
+
         # Fallback: try to extract year/month/day with regex
-        match = re.search(r'(\d{1,2})[/\-](\d{1,2})[/\-](\d{4})', dob)
+        match = _DATE_DIGITS_RE.search(dob)
         if match:
             day, month, year = match.groups()
             return datetime(int(year), int(month), int(day))
-        
+
         raise ValueError(f"Could not parse date: {dob}")
     
+    @lru_cache(maxsize=4096)
     def _parse_time(self, birth_time: str) -> Tuple[int, int]:
         """Parse birth time string into (hour, minute) tuple"""
         # Try 12-hour format (4:30 PM)
-        match = re.match(r'(\d{1,2}):(\d{2})\s*(AM|PM|am|pm)?', birth_time.strip())
+        match = _TIME_12H_RE.match(birth_time.strip())
         if match:
             hour = int(match.group(1))
             minute = int(match.group(2))
@@ -146,23 +360,25 @@ class HoroscopeService:
             return hour, minute
         
         # Try 24-hour format (16:30)
-        match = re.match(r'(\d{1,2}):(\d{2})', birth_time.strip())
+        match = _TIME_24H_RE.match(birth_time.strip())
         if match:
             return int(match.group(1)), int(match.group(2))
         
         # Default to noon
         return 12, 0
     
-    def _calculate_age(self, birth_date: date, current_date: date = None) -> int:
-        """Calculate age in years"""
-        if current_date is None:
-            current_date = date.today()
-        
+    @lru_cache(maxsize=1024)
+    def _calculate_age(self, birth_date: date, current_date: date) -> int:
+        """Calculate age in years (current_date is explicit so cached
+        entries cannot go stale across day boundaries)"""
+        # Same month*100+day integer key the calculator uses: orders like
+        # the (month, day) tuple compare without building two tuples
         age = current_date.year - birth_date.year
-        if (current_date.month, current_date.day) < (birth_date.month, birth_date.day):
+        if current_date.month * 100 + current_date.day < birth_date.month * 100 + birth_date.day:
             age -= 1
         return max(0, age)
     
+    @lru_cache(maxsize=128)
     def _get_age_segment(self, age: int) -> str:
         """Get life stage segment for appropriate advice tone"""
         if age < 25:
@@ -226,25 +442,15 @@ class HoroscopeService:
         
         return cdo.model_dump(), cdo_summary.model_dump()
     
+    @lru_cache(maxsize=384)
     def _get_fallback_zodiac(self, day: int, month: int) -> str:
         """Get zodiac sign for fallback mode (tropical)"""
-        zodiac_map = [
-            (20, "Capricorn"), (19, "Aquarius"), (20, "Pisces"), (20, "Aries"),
-            (21, "Taurus"), (21, "Gemini"), (22, "Cancer"), (23, "Leo"),
-            (23, "Virgo"), (23, "Libra"), (22, "Scorpio"), (21, "Sagittarius"),
-            (31, "Capricorn")
-        ]
-        return zodiac_map[month-1][1] if day > zodiac_map[month-1][0] else zodiac_map[month-2][1]
-    
+        doy = _MONTH_OFFSETS[month - 1] + day
+        return _ZODIAC_BY_DOY[bisect_left(_ZODIAC_CUTOFFS, doy)]
+
     def _get_fallback_ruler(self, sign: str) -> str:
         """Get planetary ruler for fallback mode"""
-        rulers = {
-            "Aries": "Mars", "Taurus": "Venus", "Gemini": "Mercury",
-            "Cancer": "Moon", "Leo": "Sun", "Virgo": "Mercury",
-            "Libra": "Venus", "Scorpio": "Mars", "Sagittarius": "Jupiter",
-            "Capricorn": "Saturn", "Aquarius": "Saturn", "Pisces": "Jupiter"
-        }
-        return rulers.get(sign, "Sun")
+        return _FALLBACK_RULERS.get(sign, "Sun")
     
     async def generate_horoscope(
         self,
@@ -273,26 +479,169 @@ class HoroscopeService:
         """
         # Check cache first
         if use_cache:
-            cache_key = f"{dob}_{birth_time}_{latitude}_{longitude}"
-            cached = cache_service.get(dob, birth_time, birth_place)
+            # Dicts are cached as objects, so a warm hit does zero parsing
+            cached = cache_service.get_obj(dob, birth_time, birth_place)
             if cached:
-                return json.loads(cached), True, "cdo"
-        
-        # Parse birth date for age calculation
+                return cached, True, "cdo"
+
+            # Single-flight: concurrent requests for the same birth
+            # details share one Gemini round-trip instead of racing N
+            # identical calls before the first one populates the cache
+            inflight_key = f"{dob}|{birth_time}|{birth_place}".lower()
+            task = self._inflight.get(inflight_key)
+            if task is not None:
+                # Shield so a cancelled follower doesn't kill the
+                # generation the other waiters share
+                return await asyncio.shield(task)
+
+            task = asyncio.ensure_future(self._generate_uncached(
+                dob, birth_time, birth_place,
+                latitude, longitude, timezone_offset, use_cache
+            ))
+            self._inflight[inflight_key] = task
+            try:
+                return await asyncio.shield(task)
+            finally:
+                self._inflight.pop(inflight_key, None)
+
+        return await self._generate_uncached(
+            dob, birth_time, birth_place,
+            latitude, longitude, timezone_offset, use_cache
+        )
+
+    async def _generate_uncached(
+        self,
+        dob: str,
+        birth_time: str,
+        birth_place: str,
+        latitude: float,
+        longitude: float,
+        timezone_offset: float,
+        use_cache: bool
+    ) -> Tuple[Dict[str, Any], bool, str]:
+        """One full generation round-trip (see generate_horoscope)"""
+        prompt_slots, cdo_summary, generation_mode = self._prepare_generation(
+            dob, birth_time, latitude, longitude, timezone_offset
+        )
+
+        try:
+            # Invoke AI with the pre-compiled prompt
+            raw_output = await self.llm.ainvoke(render_prompt(prompt_slots))
+
+            card_dict = self._finalize_card(raw_output.content, cdo_summary)
+
+            # Cache result
+            if use_cache:
+                cache_service.set_obj(dob, birth_time, birth_place, card_dict)
+
+            return card_dict, False, generation_mode
+
+        except Exception as e:
+            logger.error(f"Generation failure: {e}")
+            # Deliberately not written to the cache: the error card must
+            # not outlive the transient failure that produced it
+            return self._get_fallback_card(
+                cdo_summary.get("time_lord", "Sun"),
+                cdo_summary.get("sect", "Diurnal")
+            ), False, "fallback"
+
+    async def stream_horoscope(
+        self,
+        dob: str,
+        birth_time: str,
+        birth_place: str,
+        latitude: float = 0.0,
+        longitude: float = 0.0,
+        timezone_offset: float = 0.0,
+        use_cache: bool = True
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Generate a horoscope as a stream of incremental events.
+
+        Tokens are streamed from the LLM and scanned as they arrive: the
+        shareable front block is yielded the moment its closing brace is
+        seen, well before the long back-side prose finishes generating,
+        so a client can render the card face with no perceived wait.
+
+        Yields dicts of the form
+            {"event": "front", "data": {...front fields...}}
+            {"event": "card", "data": card_dict, "cached": bool,
+             "generation_mode": mode}
+        where the final "card" payload is identical to what
+        generate_horoscope returns.
+        """
+        if use_cache:
+            cached = cache_service.get_obj(dob, birth_time, birth_place)
+            if cached:
+                front = cached.get("front")
+                if front:
+                    yield {"event": "front", "data": front}
+                yield {"event": "card", "data": cached, "cached": True,
+                       "generation_mode": "cdo"}
+                return
+
+        prompt_slots, cdo_summary, generation_mode = self._prepare_generation(
+            dob, birth_time, latitude, longitude, timezone_offset
+        )
+
+        chunks = []
+        extractor = _FrontBlockExtractor()
+        try:
+            async for chunk in self.llm.astream(render_prompt(prompt_slots)):
+                text = chunk.content
+                if not text:
+                    continue
+                chunks.append(text)
+                front = extractor.feed(text)
+                if front is not None:
+                    yield {"event": "front", "data": front}
+
+            card_dict = self._finalize_card("".join(chunks), cdo_summary)
+            if use_cache:
+                cache_service.set_obj(dob, birth_time, birth_place, card_dict)
+            yield {"event": "card", "data": card_dict, "cached": False,
+                   "generation_mode": generation_mode}
+
+        except Exception as e:
+            logger.error(f"Streaming generation failure: {e}")
+            card_dict = self._get_fallback_card(
+                cdo_summary.get("time_lord", "Sun"),
+                cdo_summary.get("sect", "Diurnal")
+            )
+            yield {"event": "card", "data": card_dict, "cached": False,
+                   "generation_mode": "fallback"}
+
+    def _prepare_generation(
+        self,
+        dob: str,
+        birth_time: str,
+        latitude: float,
+        longitude: float,
+        timezone_offset: float
+    ) -> Tuple[PromptSlots, Dict[str, Any], str]:
+        """
+        Shared generation prelude: age context, CDO build and prompt slots.
+
+        Returns:
+            Tuple of (prompt_slots, cdo_summary, generation_mode)
+        """
+        # Parse birth date once; the fallback summary reuses the parsed
+        # object instead of re-deriving it from the dob string
+        birth_date = None
         try:
             birth_date = self._parse_date(dob)
-            age = self._calculate_age(birth_date.date())
+            age = self._calculate_age(birth_date.date(), date.today())
             age_segment = self._get_age_segment(age)
         except Exception as e:
             logger.warning(f"Date parsing failed: {e}, using defaults")
             age = 30
             age_segment = "PIVOT_ERA (Career Building & Relationships)"
-        
+
         # Try CDO generation
         generation_mode = "cdo"
         cdo_json = "{}"
         cdo_summary = {}
-        
+
         if self.cdo_enabled and latitude != 0.0 and longitude != 0.0:
             try:
                 cdo_full, cdo_summary = self._build_cdo_context(
@@ -302,76 +651,83 @@ class HoroscopeService:
                     longitude=longitude,
                     timezone_offset=timezone_offset
                 )
-                cdo_json = json.dumps(cdo_full, indent=2, default=str)
+                # msgspec's C encoder replaces json.dumps; enc_hook=str
+                # mirrors the old default=str for exotic leaf types
+                cdo_json = msgspec.json.format(
+                    _cdo_encoder.encode(cdo_full), indent=2
+                ).decode()
                 logger.info("CDO generated successfully")
             except Exception as e:
                 logger.warning(f"CDO generation failed, using fallback: {e}")
                 generation_mode = "fallback"
-                cdo_summary = self._build_fallback_summary(dob, birth_time, age)
+                cdo_summary = self._build_fallback_summary(birth_date, age)
         else:
             generation_mode = "fallback"
-            cdo_summary = self._build_fallback_summary(dob, birth_time, age)
-        
-        # Build prompt variables
-        prompt_vars = {
-            "cdo_json": cdo_json,
-            "sect": cdo_summary.get("sect", "Diurnal"),
-            "malefic_severity": cdo_summary.get("malefic_severity", "constructive"),
-            "ascendant": cdo_summary.get("ascendant", "Unknown"),
-            "time_lord": cdo_summary.get("time_lord", "Sun"),
-            "profection_house": cdo_summary.get("profection_house", 1),
-            "profection_theme": cdo_summary.get("profection_theme", "Self and Identity"),
-            "major_aspect": cdo_summary.get("major_aspect", "No major aspects"),
-            "time_lord_activation": cdo_summary.get("time_lord_activation", "No direct activations"),
-            "cusp_alert": f"**Cosmic Cusp Alert**: Ascendant on sign boundary" if cdo_summary.get("is_cusp") else "",
-            "dignity_warning": cdo_summary.get("dignity_warning", ""),
-        }
-        
+            cdo_summary = self._build_fallback_summary(birth_date, age)
+
+        # Build prompt slots (hashable, so identical charts hit the
+        # render cache)
+        prompt_slots = PromptSlots(
+            cdo_json=cdo_json,
+            sect=cdo_summary.get("sect", "Diurnal"),
+            malefic_severity=cdo_summary.get("malefic_severity", "constructive"),
+            ascendant=cdo_summary.get("ascendant", "Unknown"),
+            time_lord=cdo_summary.get("time_lord", "Sun"),
+            profection_house=cdo_summary.get("profection_house", 1),
+            profection_theme=cdo_summary.get("profection_theme", "Self and Identity"),
+            major_aspect=cdo_summary.get("major_aspect", "No major aspects"),
+            time_lord_activation=cdo_summary.get("time_lord_activation", "No direct activations"),
+            cusp_alert=f"**Cosmic Cusp Alert**: Ascendant on sign boundary" if cdo_summary.get("is_cusp") else "",
+            dignity_warning=cdo_summary.get("dignity_warning", ""),
+            format_instructions=_FORMAT_INSTRUCTIONS,
+        )
+
+        return prompt_slots, cdo_summary, generation_mode
+
+    def _finalize_card(
+        self,
+        content: str,
+        cdo_summary: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Parse the raw LLM output into a card dict and attach the summary"""
         try:
-            # Invoke AI
-            raw_output = await self.chain.ainvoke(prompt_vars)
-            
-            # Parse response
-            try:
-                card_data = self.output_parser.parse(raw_output.content)
-            except:
-                # Fallback: extract JSON from markdown blocks
-                match = re.search(r'\{.*\}', raw_output.content, re.DOTALL)
-                if match:
-                    card_data = json.loads(match.group())
-                else:
-                    raise OutputParserException("No JSON found in LLM response")
-            
-            # Validate and enhance
-            validated_card = AstroCard(**card_data)
-            
-            # Add CDO summary to response
-            if cdo_summary:
-                card_dict = validated_card.model_dump()
-                card_dict["cdo_summary"] = cdo_summary
+            # Parser success already yields the canonical dict shape -
+            # a second AstroCard(**...).model_dump() round-trip would
+            # just re-validate data the parser produced
+            card_dict = self.output_parser.parse(content)
+            if not _card_is_complete(card_dict):
+                # Well-formed JSON with fields missing: run the full
+                # validation to apply defaults or raise
+                card_dict = _ASTRO_ADAPTER.validate_python(card_dict).model_dump()
+        except (OutputParserException, ValidationError, ValueError,
+                TypeError, AttributeError):
+            # Parse/shape failures only - the old bare except pushed
+            # CancelledError (client disconnects) and MemoryError through
+            # the extraction fallback before the task could abort.
+            # Fallback: extract the balanced JSON block. This path
+            # bypassed the parser, so parse and validate it in one
+            # pydantic-core pass
+            block = _extract_json_block(content)
+            if block is not None:
+                card_dict = _ASTRO_ADAPTER.validate_json(block).model_dump()
             else:
-                card_dict = validated_card.model_dump()
-            
-            # Cache result
-            if use_cache:
-                cache_service.set(dob, birth_time, birth_place, json.dumps(card_dict))
-            
-            return card_dict, False, generation_mode
-            
-        except Exception as e:
-            logger.error(f"Generation failure: {e}")
-            return self._get_fallback_card(
-                cdo_summary.get("time_lord", "Sun"),
-                cdo_summary.get("sect", "Diurnal")
-            ), False, "fallback"
+                raise OutputParserException("No JSON found in LLM response")
+
+        # Add CDO summary to response
+        if cdo_summary:
+            card_dict["cdo_summary"] = cdo_summary
+
+        return card_dict
     
-    def _build_fallback_summary(self, dob: str, birth_time: str, age: int) -> Dict[str, Any]:
-        """Build a basic summary when CDO is not available"""
-        try:
-            birth_date = self._parse_date(dob)
+    def _build_fallback_summary(
+        self, birth_date: Optional[datetime], age: int
+    ) -> Dict[str, Any]:
+        """Build a basic summary when CDO is not available. Takes the
+        already-parsed birth date (None if parsing failed upstream)."""
+        if birth_date is not None:
             zodiac = self._get_fallback_zodiac(birth_date.day, birth_date.month)
             ruler = self._get_fallback_ruler(zodiac)
-        except:
+        else:
             zodiac = "Aries"
             ruler = "Mars"
         
@@ -392,30 +748,14 @@ class HoroscopeService:
     
     def _get_fallback_card(self, time_lord: str, sect: str) -> Dict[str, Any]:
         """Generate fallback card when everything fails"""
-        return AstroCard(
-            front=HoroscopeFront(
-                tagline="The stars are recalibrating... ✨",
-                luck_score=50,
-                vibe_status="Shaky",
-                energy_emoji="🔮",
-                zodiac_sign="Unknown",
-                time_lord=time_lord,
-                profection_house=1
-            ),
-            back=HoroscopeBack(
-                detailed_reading="Mercury retrograde in the cosmic servers. Your chart is being processed through the ethers. Check back soon for your personalized reading.",
-                hustle_alpha="Focus on grounding activities today. The stars will align shortly.",
-                shadow_warning="Avoid making major decisions until the cosmic connection stabilizes.",
-                lucky_assets=LuckyAssets(number="7", color="Silver", power_hour="Soon"),
-                time_lord_insight="Your Time Lord is gathering cosmic data.",
-                planetary_blame="Technical Mercury square Digital Saturn (Temporary)",
-                remedy="Take 5 deep breaths and try again.",
-                cusp_alert=None
-            ),
-            ruling_planet=time_lord,
-            sect=sect,
-            cdo_summary=None
-        ).model_dump()
+        # Shallow-copy the nested dicts that get patched (or that callers
+        # may write to) so the shared template stays pristine
+        card = dict(_FALLBACK_CARD_TEMPLATE)
+        card["front"] = {**card["front"], "time_lord": time_lord}
+        card["back"] = dict(card["back"])
+        card["ruling_planet"] = time_lord
+        card["sect"] = sect
+        return card
 
 
 # Global service instance